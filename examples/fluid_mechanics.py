@@ -20,35 +20,35 @@ VISCOSITY_CITATION = NASA_GCR_WEBSITE.citation(
 )
 
 # %% Symbols
-Rs, gamma_g, N, l, A = [
-    Symbol(
-        "Rs",
+Rs, gamma_g, N, l, A = Symbol.batch([
+    dict(
+        name="Rs",
         description="specific gas constant",
         latex="R_s",
         units=ureg.J / (ureg.kg * ureg.K)
     ),
-    Symbol(
-        "gamma_g",
+    dict(
+        name="gamma_g",
         description="gas ratio of specific heats",
         latex="\\gamma",
         units=ureg.dimensionless
     ),
-    Symbol(
-        "N",
+    dict(
+        name="N",
         description="rotational speed",
         units=ureg.rpm
     ),
-    Symbol(
-        "l",
+    dict(
+        name="l",
         description="characteristic length of problem",
         units=ureg.m,
     ),
-    Symbol(
-        "A",
+    dict(
+        name="A",
         description="annulus flow area",
         units=ureg.m ** 2,
     )
-]
+])
 
 # Gas Specific Heat at Constant Pressure
 Cpg = Symbol(
@@ -166,7 +166,7 @@ mdot_corr_compressible = Symbol(
 
 mdot_corr = Symbol(
     "mdot_corr",
-    mdot * sqrt(T0/T0_ref)/sqrt(P0/P0_ref),
+    mdot * sqrt((T0/T0_ref) / (P0/P0_ref)),
     description="corrected mass flow rate",
     latex="\\dot{m}_{corr}",
     units=ureg.kg/ureg.s
@@ -1,5 +1,5 @@
 # %% Imports
-from sympy import Piecewise
+from sympy import Max
 from examples.fluid_mechanics import M, Rs, u, gamma_g, Cpg
 from examples.thermodynamics import T0, P0, P, T, PR, T02, P02, gamma, Cp
 from theoris import Symbol, FunctionSymbol, SymbolMapping, DataObject, Section, Documentation
@@ -94,12 +94,11 @@ P01_i = FunctionSymbol(
 
 
 # %%  Engine Inlet Pressure Ratio
+# Branchless form of the MIL-E-5008B recovery: Max(M - 1, 0) zeroes the
+# supersonic loss term for M <= 1, so both regimes share one expression
 PR_i = Symbol.inherit(
     PR,
-    Piecewise(
-        (1.0, M_i <= 1),
-        (1.0 - 0.075*(M_i - 1.0) ** 1.35, M_i > 1),
-    ),
+    1.0 - 0.075 * Max(M_i - 1.0, 0.0) ** 1.35,
     name="PR_i",
     description="{description} between engine inlet and compressor and/or fan",
     latex="PR_i"
@@ -1,61 +1,74 @@
 # %% Imports
+from functools import lru_cache
 from pathlib import Path
-from sympy import solve
 from theoris.generators.code import CodeGenerator
 from theoris.utils.units import ureg
 from theoris import Section, Symbol, ExternalFunctionSymbol,  Documentation
 
 DOC_NAME = "Thermodynamics"
 
+
+@lru_cache(maxsize=None)
+def _cached_solve(expression, symbol):
+    """
+    Memoized sympy.solve so repeated identical solves skip the symbolic algebra.
+
+    SymPy expressions are hashable, so the (expression, symbol) pair keys the
+    cache directly and re-solving the same rearrangement is a dictionary lookup.
+    solve is imported here so just importing the symbols stays cheap.
+    """
+    from sympy import solve
+    return solve(expression, symbol)[0]
+
 # %% Symbols
-T, T0, P0, T01, P01, PR, eta_poly, u = [
-    Symbol(
-        "T",
+T, T0, P0, T01, P01, PR, eta_poly, u = Symbol.batch([
+    dict(
+        name="T",
         description="static fluid temperature",
         latex="T",
         units=ureg.K
     ),
-    Symbol(
-        "T0",
+    dict(
+        name="T0",
         description="stagnation temperature",
         latex="T_0",
         units=ureg.K
     ),
-    Symbol(
-        "P0",
+    dict(
+        name="P0",
         description="stagnation pressure",
         latex="P_0",
         units=ureg.Pa
     ),
-    Symbol(
-        "T01",
+    dict(
+        name="T01",
         description="stagnation inlet temperature",
         latex="T_{01}",
         units=ureg.K
     ),
-    Symbol(
-        "P01",
+    dict(
+        name="P01",
         description="stagnation inlet pressure",
         latex="T_{01}",
         units=ureg.Pa
     ),
-    Symbol(
-        "PR",
+    dict(
+        name="PR",
         description="pressure ratio",
         units=ureg.dimensionless
     ),
-    Symbol(
-        "eta_poly",
+    dict(
+        name="eta_poly",
         description="polytropic efficiency",
         latex="\\eta_{poly}",
         units=ureg.dimensionless
     ),
-    Symbol(
-        "u",
+    dict(
+        name="u",
         description="flow velocity",
         units=ureg.m/ureg.s
     ),
-]
+])
 
 # %% Ratio of Specific Heats
 gamma = ExternalFunctionSymbol(
@@ -83,11 +96,6 @@ P02 = Symbol(
     units=ureg.Pa
 )
 
-# %% Pressure Ratio
-PR.set_expression(
-    P02 / P01
-)
-
 # %% Outlet Stagnation Temperature
 T02 = Symbol(
     "T02",
@@ -130,7 +138,7 @@ T.set_expression(
 
 # %% Stagnation Temperature
 T0.set_expression(
-    solve(T.expression - T, T0)[0]
+    _cached_solve(T.expression - T, T0)
 )
 
 # %% Static Pressure
@@ -144,12 +152,7 @@ P = Symbol(
 
 # %% Stagnation Pressure
 P0.set_expression(
-    solve(P.expression - P, P0)[0]
-)
-
-# %% Stagnation Temperature
-T0.set_expression(
-    solve(T.expression - T, T0)[0]
+    _cached_solve(P.expression - P, P0)
 )
 
 # %% Documentation
@@ -2,6 +2,8 @@ import unittest
 from pint import Quantity
 from theoris.utils.units import ureg
 from theoris.utils.units import validate_units
+from theoris import Symbol, Section, Documentation
+from theoris.generators.code import CodeGenerator
 
 
 @validate_units(alpha="m", returns="m**2")
@@ -30,5 +32,149 @@ class CodegenValidateUnitsTest(unittest.TestCase):
         self.assertAlmostEqual(alpha_squared_actual, alpha_squared_expected)
 
 
+class CodegenNumbaVariantTest(unittest.TestCase):
+
+    def get_documentation(self):
+        m = Symbol("m", description="mass", units=ureg.kg)
+        v = Symbol("v", description="velocity", units=ureg.m / ureg.s)
+        E_k = Symbol("E_k", 0.5 * m * v**2,
+                     description="kinetic energy", units=ureg.J)
+        return Documentation(
+            "Kinetic Energy Test",
+            [Section.from_symbol(E_k, "Kinetic Energy", args=[m, v])]
+        )
+
+    def test_numba_variant_emitted(self):
+        cgen = CodeGenerator("out", use_numba=True)
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertIn("from numba import njit, vectorize, float64", code_str)
+        self.assertIn("@njit(cache=True, fastmath=True)", code_str)
+        self.assertIn("def calc_kinetic_energy_fast(m: float, v: float):", code_str)
+        self.assertIn(
+            "@vectorize([float64(float64, float64)], target='parallel', fastmath=True)",
+            code_str
+        )
+        self.assertIn("def calc_kinetic_energy_v(m: float, v: float):", code_str)
+
+    def test_numba_variant_not_emitted_by_default(self):
+        cgen = CodeGenerator("out")
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertNotIn("njit", code_str)
+
+    def test_strip_units_emits_plain_numeric_code(self):
+        cgen = CodeGenerator("out", strip_units=True)
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertNotIn("validate_units", code_str)
+        self.assertNotIn("ureg", code_str)
+        self.assertIn("def calc_kinetic_energy(m: float, v: float):", code_str)
+        # Units survive as documentation metadata
+        self.assertIn("mass (1 kilogram)", code_str)
+
+
+class CodegenInlineConstantsTest(unittest.TestCase):
+
+    def get_documentation(self):
+        m = Symbol("m", description="mass", units=ureg.kg)
+        h = Symbol("h", description="height", units=ureg.m)
+        g = Symbol("g", 9.81, description="gravity",
+                   units=ureg.m / ureg.s**2)
+        E_p = Symbol("E_p", m * g * h,
+                     description="potential energy", units=ureg.J)
+        return Documentation(
+            "Potential Energy Test",
+            [Section.from_symbol(E_p, "Potential Energy", args=[m, h, g])]
+        )
+
+    def test_constant_arg_moves_into_body(self):
+        cgen = CodeGenerator("out", inline_constants=True)
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertIn("def calc_potential_energy(m: float, h: float, units", code_str)
+        self.assertNotIn("g: float", code_str)
+        self.assertIn("ureg.Quantity(1, \"1 meter / second ** 2\")", code_str)
+
+    def test_constant_folds_into_strip_units_body(self):
+        cgen = CodeGenerator("out", strip_units=True, inline_constants=True)
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertIn("def calc_potential_energy(m: float, h: float):", code_str)
+        self.assertIn("9.81*h*m", code_str)
+
+    def test_constants_stay_parameters_by_default(self):
+        cgen = CodeGenerator("out")
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        self.assertIn("g: float", code_str)
+
+
+class CodegenCseTest(unittest.TestCase):
+
+    def get_documentation(self):
+        from sympy import sqrt
+        x = Symbol("x", description="first input")
+        y = Symbol("y", description="second input")
+        r_mid = Symbol("r_mid", sqrt(x + y),
+                       description="root of the shared sum")
+        r = Symbol("r", (x + y)**3 + r_mid,
+                   description="combined result")
+        return Documentation(
+            "CSE Test",
+            [Section.from_symbol(r, "Combined Result", args=[x, y])]
+        )
+
+    def get_calc(self, cgen):
+        code_str = cgen.get_documentation_code_str(self.get_documentation())
+        namespace = {}
+        exec(code_str, namespace)
+        return code_str, namespace["calc_combined_result"]
+
+    def test_cse_temporary_emitted_before_first_use(self):
+        code_str, _ = self.get_calc(CodeGenerator("out", strip_units=True))
+        self.assertIn("_cse0 = x + y", code_str)
+        # The shared sum is hoisted once, above the statements that use it
+        self.assertLess(code_str.index("_cse0 = x + y"),
+                        code_str.index("np.sqrt(_cse0)"))
+        self.assertEqual(code_str.count("x + y"), 1)
+
+    def test_cse_output_matches_plain_output(self):
+        _, calc_cse = self.get_calc(
+            CodeGenerator("out", strip_units=True))
+        plain_code_str, calc_plain = self.get_calc(
+            CodeGenerator("out", strip_units=True, use_cse=False))
+        self.assertNotIn("_cse0", plain_code_str)
+        self.assertAlmostEqual(calc_cse(2.0, 3.0), calc_plain(2.0, 3.0))
+
+
+class CodegenPiecewiseTest(unittest.TestCase):
+
+    def test_piecewise_prints_as_numpy_where(self):
+        from sympy import Piecewise
+        from theoris.utils.sympy import NumPyPrinter
+        M = Symbol("M", description="Mach number")
+        expr = Piecewise((1.0, M <= 1), (1.0 - 0.075 * (M - 1.0)**1.35, True))
+        code_str = NumPyPrinter().doprint(expr)
+        self.assertIn("numpy.where", code_str)
+        self.assertNotIn("numpy.select", code_str)
+
+    def test_pow_fast_paths(self):
+        from theoris.utils.sympy import NumPyPrinter
+        M = Symbol("M", description="Mach number")
+        printer = NumPyPrinter()
+        self.assertEqual(printer.doprint(M**2), "M*M")
+        self.assertEqual(printer.doprint(M**-0.5), "1/numpy.sqrt(M)")
+        self.assertEqual(printer.doprint(M**-3.0), "M**(-3)")
+        # Genuinely fractional exponents keep libm pow
+        self.assertEqual(printer.doprint(M**1.35), "M**1.35")
+
+    def test_max_prints_as_numpy_maximum(self):
+        from sympy import Max, Min
+        from theoris.utils.sympy import NumPyPrinter
+        M = Symbol("M", description="Mach number")
+        a = Symbol("a", description="speed of sound")
+        printer = NumPyPrinter()
+        self.assertEqual(printer.doprint(Max(M - 1.0, 0.0)),
+                         "numpy.maximum(0.0, M - 1.0)")
+        self.assertEqual(printer.doprint(Min(M, a)),
+                         "numpy.minimum(M, a)")
+        self.assertNotIn("amax", printer.doprint(Max(M, a, 1.0)))
+
+
 if __name__ == '__main__':
     unittest.main()
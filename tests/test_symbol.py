@@ -1,5 +1,7 @@
+import pickle
 import unittest
 from pint import Quantity
+from theoris import Documentation, Section
 from theoris.utils.units import ureg
 from theoris.base_symbol import BaseSymbol
 from theoris.symbol import Symbol
@@ -22,6 +24,49 @@ class TestSymbol(unittest.TestCase):
         self.assertEqual(symbol.description, "A test symbol")
         self.assertEqual(symbol.units, ureg.dimensionless)  # Default is dimensionless
 
+    def test_batch_normalizes_units(self):
+        a, b = Symbol.batch([
+            dict(name="a", description="first temperature", units=ureg.K),
+            dict(name="b", description="second temperature", units="K"),
+        ])
+
+        # BaseSymbol stores bare units as 1-Quantities
+        self.assertEqual(a.units, ureg.Quantity(1, ureg.K))
+        self.assertEqual(b.units, ureg.Quantity(1, ureg.K))
+        # Derived symbols can compare the units of their dependencies
+        total = Symbol("total", a + b, description="temperature sum")
+        self.assertEqual(total.units, ureg.Quantity(1, ureg.K))
+
+    def test_symbol_pickle_round_trip(self):
+        symbol = Symbol(name="TestSymbol", description="A test symbol",
+                        units=ureg.m)
+        restored = pickle.loads(pickle.dumps(symbol))
+
+        self.assertEqual(restored.name, "TestSymbol")
+        self.assertEqual(restored.description, "A test symbol")
+        # BaseSymbol stores bare units as 1-Quantities
+        self.assertEqual(restored.units, ureg.Quantity(1, ureg.m))
+
+
+class TestDocumentationPickle(unittest.TestCase):
+    def test_documentation_round_trip(self):
+        m = Symbol("m", description="mass", units=ureg.kg)
+        v = Symbol("v", description="velocity", units=ureg.m / ureg.s)
+        E_k = Symbol("E_k", 0.5 * m * v**2,
+                     description="kinetic energy", units=ureg.J)
+        documentation = Documentation(
+            "Kinetic Energy Test",
+            [Section.from_symbol(E_k, "Kinetic Energy", args=[m, v])]
+        )
+
+        restored = pickle.loads(pickle.dumps(documentation))
+        section = restored.exports[0]
+
+        self.assertEqual(restored.name, "Kinetic Energy Test")
+        self.assertEqual(section.returns.name, "E_k")
+        self.assertEqual(section.returns.units, ureg.Quantity(1, ureg.J))
+        self.assertEqual([arg.name for arg in section.args], ["m", "v"])
+
 
 if __name__ == '__main__':
     unittest.main()
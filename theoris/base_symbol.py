@@ -3,7 +3,7 @@ from theoris.doc_object import DocObject
 import sympy
 from pint import Quantity
 from theoris.utils.ordered_set import OrderedSet
-from theoris.utils.units import ureg
+from theoris.utils.units import ureg, DIMENSIONLESS, parse_units
 from theoris.utils.logging import logger
 
 
@@ -16,16 +16,21 @@ class SymbolCodeCtx:
 
     Attributes:
         func_start_name: The prefix to use for function names in generated code.
+        strip_units: Whether to emit plain numeric code without pint unit
+                     wrapping, for unit-free (e.g. numba-compiled) variants.
     """
 
-    def __init__(self, func_start_name: str):
+    def __init__(self, func_start_name: str, strip_units: bool = False):
         """
         Initialize a SymbolCodeCtx with a function name prefix.
 
         Args:
             func_start_name: The prefix to use for function names in generated code.
+            strip_units: Whether to emit plain numeric code without pint unit
+                         wrapping. Defaults to False.
         """
         self.func_start_name = func_start_name
+        self.strip_units = strip_units
 
 
 NumType = Literal["real", "int"]
@@ -51,6 +56,22 @@ class BaseSymbol(sympy.Symbol, DocObject):
         has_forced_unit_conversion: Whether unit conversion is forced for this symbol.
     """
 
+    # Symbols are by far the most numerous objects in a documentation tree;
+    # slots drop the per-instance __dict__ ("name" is already a slot on
+    # sympy.Symbol). Subclasses that declare no slots keep their own __dict__
+    # for any extra attributes.
+    __slots__ = (
+        "description",
+        "latex",
+        "units",
+        "num_type",
+        "section",
+        "is_global",
+        "is_simplified",
+        "has_forced_unit_conversion",
+        "documentation",
+    )
+
     def __init__(self, name: str,
                  section=None,
                  description: str = None,
@@ -85,9 +106,9 @@ class BaseSymbol(sympy.Symbol, DocObject):
             # If it's already a Quantity, use it
             if isinstance(units, Quantity):
                 self.units = units
-            # If it's a string, parse it
+            # If it's a string, parse it (memoized per distinct string)
             elif isinstance(units, str):
-                self.units = ureg.parse_expression(units)
+                self.units = parse_units(units)
             # Otherwise, assume it's a valid unit expression
             else:
                 try:
@@ -97,9 +118,9 @@ class BaseSymbol(sympy.Symbol, DocObject):
                     # If that fails, use dimensionless
                     logger.warning(
                         f"{name} has invalid units {units}, using dimensionless")
-                    self.units = ureg.dimensionless
+                    self.units = DIMENSIONLESS
         else:
-            self.units = ureg.dimensionless
+            self.units = DIMENSIONLESS
         self.num_type = num_type
 
         from theoris.section import Section
@@ -113,6 +134,31 @@ class BaseSymbol(sympy.Symbol, DocObject):
             logger.warning(
                 f"{self.name} has has_forced_unit_conversion which is not advised for safety")
 
+    def __getnewargs_ex__(self):
+        # sympy.Symbol pickles as (name, assumptions), which does not match
+        # our __new__ signature; the clean name is enough since __new__
+        # prefixes a fresh uuid on allocation
+        return ((self.name,), {})
+
+    def __getstate__(self):
+        # Slotted symbols have no __dict__ for the default protocol to
+        # capture, so walk the MRO and collect every populated slot
+        # (including sympy's name/_assumptions) alongside any subclass dict
+        slots_state = {}
+        for klass in type(self).__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+                if hasattr(self, slot):
+                    slots_state[slot] = getattr(self, slot)
+        dict_state = dict(self.__dict__) if hasattr(self, "__dict__") else None
+        return (dict_state, slots_state)
+
+    def __setstate__(self, state):
+        dict_state, slots_state = state
+        if dict_state:
+            self.__dict__.update(dict_state)
+        for slot, value in slots_state.items():
+            setattr(self, slot, value)
+
     @property
     def type_hint(self) -> str:
         return "int" if self.num_type == "int" else "float"
@@ -1,12 +1,12 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-
 def generate_diagram(blocks):
     """
     Generate a diagram from block inputs and outputs.
 
     :param blocks: A list of blocks, where each block is a dictionary with 'name', 'inputs', and 'outputs'.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.DiGraph()
 
     for block in blocks:
@@ -17,6 +17,10 @@ class DocObject:
     # from theoris.documentation import Documentation
     documentation: Any
 
+    # Empty so slotted subclasses (BaseSymbol) avoid a per-instance __dict__;
+    # the documentation attribute lives in the subclass slots or dict
+    __slots__ = ()
+
     def __init__(self, documentation: Any):
         """
         Initialize a DocObject with a reference to its Documentation.
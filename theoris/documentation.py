@@ -1,3 +1,7 @@
+import os
+import pickle
+from pathlib import Path
+from typing import Callable
 from theoris.doc_object import DocObject
 from theoris.base_symbol import BaseSymbol
 from theoris.section import Section
@@ -65,6 +69,68 @@ class Documentation:
                     raise ValueError(
                         "Only global symbols allowed in Documentation top-level")
                     
+    def save(self, cache_path: Path | str):
+        """
+        Pickle this Documentation (sections, symbols and expressions) to disk.
+
+        Args:
+            cache_path: The file path to write the pickle to. Parent
+                       directories are created if needed.
+        """
+        cache_path = Path(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(cache_path: Path | str) -> "Documentation":
+        """
+        Load a previously saved Documentation from disk.
+
+        Args:
+            cache_path: The file path of the pickle written by save().
+
+        Returns:
+            The unpickled Documentation object.
+        """
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        cache_path: Path | str,
+        build: Callable[[], "Documentation"],
+        source_path: Path | str = None
+    ) -> "Documentation":
+        """
+        Load a cached Documentation, rebuilding when the source is newer.
+
+        Skips the symbolic construction cost (sympy solves, unit derivation)
+        entirely when the cached pickle is up to date.
+
+        Args:
+            cache_path: The file path of the pickle cache.
+            build: Zero-argument callable that constructs the Documentation
+                  when the cache is missing or stale.
+            source_path: Optional source file whose mtime invalidates the
+                        cache; typically __file__ of the defining module.
+
+        Returns:
+            The cached or freshly built Documentation object.
+        """
+        cache_path = Path(cache_path)
+        if cache_path.exists():
+            is_stale = (
+                source_path is not None
+                and os.path.getmtime(source_path) > os.path.getmtime(cache_path)
+            )
+            if not is_stale:
+                return cls.load(cache_path)
+        documentation = build()
+        documentation.save(cache_path)
+        return documentation
+
     def __repr__(self) -> str:
         """
         Generate a string representation of the documentation.
@@ -1,11 +1,16 @@
 from pathlib import Path
 from typing import Union
+import sympy
 from theoris.data_object import DataObject
-from theoris.extensions.external_function import ExternalFunctionSymbol
+from theoris.extensions.external_function import (
+    ExternalFunctionSymbol,
+    ExternalFunctionCallerSymbol
+)
 from theoris.base_symbol import SymbolCodeCtx
 from theoris import Symbol, Documentation, BaseSymbol, Section
 from theoris.utils.symbols import get_code_name, is_symbol_constant
 from theoris.utils.logging import logger
+from theoris.utils.sympy import NumPyPrinter
 
 # String constants
 newline = "\n"
@@ -19,12 +24,26 @@ class CodeGenerator:
                  package_path: Path | str,
                  header: str = None,
                  indent: str = " " * 4,
-                 func_start_name: str = "calc") -> None:
+                 func_start_name: str = "calc",
+                 use_numba: bool = False,
+                 use_cse: bool = True,
+                 strip_units: bool = False,
+                 inline_constants: bool = False) -> None:
         self.package_path = Path(package_path)
         self.header = header
         self.indent = indent
         self.func_start_name = func_start_name
-        self.ctx = SymbolCodeCtx(func_start_name)
+        self.use_numba = use_numba
+        self.use_cse = use_cse
+        # With strip_units the generated functions take and return plain
+        # floats; units only survive as documentation metadata
+        self.strip_units = strip_units
+        # With inline_constants, fixed numeric symbols (e.g. gravity or
+        # reference conditions) are specialized into the section body rather
+        # than taken as parameters
+        self.inline_constants = inline_constants
+        self.ctx = SymbolCodeCtx(func_start_name, strip_units=strip_units)
+        self.strip_units_ctx = SymbolCodeCtx(func_start_name, strip_units=True)
 
     def get_import_str(self, module_namespace: str, imports: list[str]):
         import_objects_str = comma_space.join(imports)
@@ -60,8 +79,17 @@ class CodeGenerator:
             f"class {class_name}(BaseModel):"
         )
 
+    def get_type_hint_str(self, symbol: BaseSymbol):
+        type_str = symbol.type_hint
+        if self.strip_units:
+            # Unit-stripped modules have no pint import and pass plain
+            # floats, so Quantity hints (e.g. external function callables)
+            # become float hints
+            type_str = type_str.replace("Quantity", "float")
+        return type_str
+
     def get_class_attribute_str(self, attribute: BaseSymbol):
-        type_str = attribute.type_hint
+        type_str = self.get_type_hint_str(attribute)
         # Include unit information in the description
         description = f"{attribute.description} ({attribute.units_str})"
         return f"{attribute.name}: {type_str} = Field(description=\"{description}\")"
@@ -70,7 +98,7 @@ class CodeGenerator:
     def get_parameter_str(self, parameter: BaseSymbol):
         return (
             "{name}: {_type}"
-            .format(name=parameter.name, _type=parameter.type_hint)
+            .format(name=parameter.name, _type=self.get_type_hint_str(parameter))
         )
 
     def get_units_param_str(self, returns: BaseSymbol):
@@ -195,10 +223,79 @@ class CodeGenerator:
             ]
         )
 
+    def get_section_cse_plan(self, section: Section):
+        """
+        Build a common subexpression elimination plan for a section.
+
+        Runs sympy.cse over the inline symbolic statements of the section and
+        assigns each extracted subexpression to the first statement that
+        (transitively) references it, so temporaries are emitted just before
+        their first use.
+
+        Returns:
+            Tuple (hoisted, reduced_expressions) where hoisted maps each
+            statement to the list of (temporary, subexpression) pairs to emit
+            before it and reduced_expressions maps each statement to its
+            rewritten expression. Both are empty when CSE is disabled or finds
+            nothing to extract.
+        """
+        if not self.use_cse:
+            return {}, {}
+
+        cse_statements = [
+            statement for statement in section.statements
+            if statement.is_assigned()
+            and isinstance(statement, Symbol)
+            and (statement.section is None or statement.section.name is section.name)
+            and isinstance(statement.expression, sympy.Basic)
+        ]
+        if len(cse_statements) == 0:
+            return {}, {}
+
+        replacements, reduced = sympy.cse(
+            [statement.expression for statement in cse_statements],
+            symbols=sympy.numbered_symbols("_cse")
+        )
+        if len(replacements) == 0:
+            return {}, {}
+
+        reduced_expressions = dict(zip(cse_statements, reduced))
+        replacement_map = dict(replacements)
+        hoisted = {statement: [] for statement in cse_statements}
+        emitted = set()
+
+        for statement, reduced_expr in zip(cse_statements, reduced):
+            # Collect the temporaries this statement depends on, following
+            # temporaries that reference other temporaries
+            needed = set()
+            stack = list(reduced_expr.free_symbols)
+            while stack:
+                free_symbol = stack.pop()
+                if free_symbol in replacement_map and free_symbol not in needed:
+                    needed.add(free_symbol)
+                    stack.extend(replacement_map[free_symbol].free_symbols)
+            # Replacements come out of sympy.cse in dependency order
+            for temporary, subexpression in replacements:
+                if temporary in needed and temporary not in emitted:
+                    emitted.add(temporary)
+                    hoisted[statement].append((temporary, subexpression))
+
+        return hoisted, reduced_expressions
+
+    def get_cse_statement_str(self, temporary, subexpression):
+        subexpression_str = (
+            NumPyPrinter().doprint(subexpression)
+            .replace("numpy.", "np.")
+        )
+        return f"{temporary} = {subexpression_str}"
+
     def get_func_return_str(self, section: Section):
         returns = section.returns
         return_object_str = None
-        if isinstance(returns, DataObject):
+        if self.strip_units and not isinstance(returns, DataObject):
+            # Unit-free values need no Quantity wrapping
+            return_object_str = f"{returns}"
+        elif isinstance(returns, DataObject):
             return_object_str = self.get_instantiation_str(
                 returns.name, returns.attributes)
         elif isinstance(returns, Symbol) and (is_symbol_constant(returns) or returns.is_magnitude):
@@ -208,61 +305,388 @@ class CodeGenerator:
 
         return f"return {return_object_str}"
 
+    def load_statement_import(self, statement: BaseSymbol, section: Section, module_imports: dict[str, set]):
+        statement_module_section = statement.get_module_section()
+        if statement_module_section is not None:
+            statement_documentation = statement_module_section.documentation
+            statement_documentation_namespace = self.get_documentation_namespace(
+                statement_documentation)
+
+            if (module_imports is not None and
+                    statement_documentation.name is not section.documentation.name):
+                statement_func_name = get_code_name(
+                    statement_module_section.name, self.func_start_name)
+                if statement_documentation_namespace not in module_imports:
+                    module_imports[statement_documentation_namespace] = set(
+                    )
+                module_imports[statement_documentation_namespace].add(
+                    statement_func_name)
+
     def load_module_imports(self, section: Section, module_imports: dict[str, set]):
         for statement in section.statements:
             if statement.is_assigned():
-                statement_module_section = statement.get_module_section()
-                if statement_module_section is not None:
-                    statement_documentation = statement_module_section.documentation
-                    statement_documentation_namespace = self.get_documentation_namespace(
-                        statement_documentation)
-
-                    if (module_imports is not None and
-                            statement_documentation.name is not section.documentation.name):
-                        statement_func_name = get_code_name(
-                            statement_module_section.name, self.func_start_name)
-                        if statement_documentation_namespace not in module_imports:
-                            module_imports[statement_documentation_namespace] = set(
+                self.load_statement_import(statement, section, module_imports)
+
+    def get_section_code_str(self, section: Section, module_imports: dict[str, set] = None):
+        signature_args = self.get_signature_args(section)
+        inlined_args = [
+            arg for arg in section.args if arg not in signature_args
+        ]
+
+        if self.strip_units:
+            # No runtime unit validation and no units keyword; units remain
+            # visible in the docstring only
+            definition_str = self.get_func_definition_str(
+                section.name, signature_args, self.func_start_name)
+        else:
+            definition_str = newline.join(
+                [
+                    self.get_unit_validator_decorator_str(
+                        signature_args, section.returns),
+                    self.get_func_definition_str(
+                        section.name, signature_args, self.func_start_name, returns=section.returns),
+                ]
+            )
+
+        func_elements = [
+            definition_str,
+            self.get_code_docs_str(signature_args, section.description)
+        ]
+
+        # Folding constant values into expressions is only unit-safe on
+        # magnitude code; unit-carrying bodies keep constants as Quantity
+        # statements instead of parameters
+        fold_constants = self.inline_constants and self.strip_units
+        folded_originals = (
+            self.fold_section_constants(section) if fold_constants else {}
+        )
+        try:
+            if not fold_constants:
+                for inlined_arg in inlined_args:
+                    func_elements.append(
+                        self.get_func_statement_str(inlined_arg, section)
+                    )
+
+            hoisted, reduced_expressions = self.get_section_cse_plan(section)
+
+            for statement in section.statements:
+                if fold_constants and self.is_numeric_constant(statement):
+                    # Folded into downstream expressions already
+                    continue
+                if statement.is_assigned():
+                    if module_imports is not None:
+                        # Collect cross-module imports in the same statement walk
+                        # instead of a separate load_module_imports pass
+                        self.load_statement_import(
+                            statement, section, module_imports)
+                    for temporary, subexpression in hoisted.get(statement, []):
+                        func_elements.append(
+                            self.get_cse_statement_str(temporary, subexpression)
+                        )
+                    if statement in reduced_expressions:
+                        original_expression = statement.expression
+                        statement.expression = reduced_expressions[statement]
+                        try:
+                            func_elements.append(
+                                self.get_func_statement_str(statement, section)
                             )
-                        module_imports[statement_documentation_namespace].add(
-                            statement_func_name)
+                        finally:
+                            statement.expression = original_expression
+                    else:
+                        func_elements.append(
+                            self.get_func_statement_str(statement, section)
+                        )
+
+            func_elements.append(
+                self.get_func_return_str(section)
+            )
+        finally:
+            self.restore_section_expressions(folded_originals)
+
+        return ("\n\n" + self.indent).join(
+            func_elements
+        )
+
+    def is_pure_numeric_section(self, section: Section) -> bool:
+        """
+        Check whether a section can be compiled to a unit-free numeric function.
+
+        A section qualifies when it returns a single symbol, takes only
+        float-typed arguments and all of its assigned statements are inline
+        symbolic expressions (no calls into other sections, no external
+        function callables and no piecewise branches), so the emitted body is
+        plain arithmetic over floats.
+        """
+        external_function_types = (
+            ExternalFunctionSymbol, ExternalFunctionCallerSymbol)
+        if not isinstance(section.returns, BaseSymbol):
+            return False
+        for arg in section.args:
+            # Callable (or otherwise non-float) arguments cannot cross a
+            # numba float signature
+            if isinstance(arg, external_function_types):
+                return False
+            if arg.type_hint != "float":
+                return False
+        for statement in section.statements:
+            if not statement.is_assigned():
+                continue
+            if not isinstance(statement, Symbol):
+                return False
+            if statement.section is not None and statement.section.name is not section.name:
+                return False
+            if isinstance(statement.expression, sympy.Piecewise):
+                return False
+            if not isinstance(statement.expression, (sympy.Basic, float, int)):
+                return False
+            if isinstance(statement.expression, sympy.Basic) and \
+                    statement.expression.atoms(*external_function_types):
+                return False
+        return True
+
+    def is_numeric_constant(self, symbol: BaseSymbol) -> bool:
+        """
+        Check whether a symbol is a fixed numeric value (e.g. gravity or a
+        reference condition) eligible for constant inlining.
+        """
+        return (
+            isinstance(symbol, Symbol)
+            and symbol.is_assigned()
+            and isinstance(symbol.expression, (int, float, sympy.Number))
+        )
+
+    def get_signature_args(self, section: Section) -> list[BaseSymbol]:
+        """
+        Get the arguments the generated function should take.
+
+        With inline_constants, fixed numeric arguments are specialized into
+        the body instead of being parameters.
+        """
+        if not self.inline_constants:
+            return section.args
+        return [
+            arg for arg in section.args
+            if not self.is_numeric_constant(arg)
+        ]
+
+    def fold_section_constants(self, section: Section) -> dict:
+        """
+        Substitute the section's numeric constants into its expressions.
+
+        Partial evaluation for unit-free bodies: constant symbols (arguments
+        or statements) are replaced by their values so sympy folds derived
+        subexpressions (e.g. T0_ref + C) before printing. Only valid when
+        emitting magnitudes, since folding drops the constants' units.
+
+        Returns:
+            Dict mapping each rewritten statement to its original expression,
+            for the caller to restore after emission.
+        """
+        constant_values = {
+            symbol: sympy.Float(symbol.expression)
+            for symbol in list(section.args) + list(section.statements)
+            if self.is_numeric_constant(symbol)
+        }
+        originals = {}
+        if len(constant_values) == 0:
+            return originals
+        for statement in section.statements:
+            if statement in constant_values:
+                continue
+            if isinstance(getattr(statement, "expression", None), sympy.Basic):
+                originals[statement] = statement.expression
+                statement.expression = statement.expression.xreplace(
+                    constant_values)
+        return originals
+
+    def restore_section_expressions(self, originals: dict):
+        for statement, expression in originals.items():
+            statement.expression = expression
+
+    def get_strip_units_statement_strs(self, section: Section) -> list[str]:
+        """
+        Get the unit-free statement strings for a section body.
+
+        Applies the section's CSE plan and prints each assigned statement as
+        plain numeric code without Quantity wrapping.
+        """
+        statement_strs = []
+        folded_originals = (
+            self.fold_section_constants(section)
+            if self.inline_constants else {}
+        )
+        try:
+            hoisted, reduced_expressions = self.get_section_cse_plan(section)
+
+            for statement in section.statements:
+                if self.inline_constants and self.is_numeric_constant(statement):
+                    # Folded into downstream expressions already
+                    continue
+                if statement.is_assigned():
+                    for temporary, subexpression in hoisted.get(statement, []):
+                        statement_strs.append(
+                            self.get_cse_statement_str(
+                                temporary, subexpression)
+                        )
+                    if statement in reduced_expressions:
+                        original_expression = statement.expression
+                        statement.expression = reduced_expressions[statement]
+                        try:
+                            statement_strs.append(
+                                statement._repr_code_(self.strip_units_ctx)
+                            )
+                        finally:
+                            statement.expression = original_expression
+                    else:
+                        statement_strs.append(
+                            statement._repr_code_(self.strip_units_ctx)
+                        )
+        finally:
+            self.restore_section_expressions(folded_originals)
+
+        return statement_strs
+
+    def get_fast_section_code_str(self, section: Section):
+        """
+        Generate a numba-compiled, unit-free variant of a section function.
+
+        The variant takes and returns plain floats (magnitudes in the units
+        documented on the main function) and is decorated with
+        njit(cache=True, fastmath=True) so repeated scalar evaluation skips
+        both pint and the Python interpreter.
+        """
+        func_name = get_code_name(section.name, self.func_start_name) + "_fast"
+        signature_args = self.get_signature_args(section)
+        parameters_str = comma_space.join(
+            self.get_parameter_str(arg) for arg in signature_args
+        )
 
-    def get_section_code_str(self, section: Section):
         func_elements = [
             newline.join(
                 [
-                    self.get_unit_validator_decorator_str(
-                        section.args, section.returns),
-                    self.get_func_definition_str(
-                        section.name, section.args, self.func_start_name, returns=section.returns),
+                    "@njit(cache=True, fastmath=True)",
+                    f"def {func_name}({parameters_str}):",
                 ]
             ),
-            self.get_code_docs_str(section.args, section.description)
+            self.get_code_docs_str(
+                signature_args,
+                f"{section.description} (unit-free fast variant)"
+            ),
+        ] + self.get_strip_units_statement_strs(section) + [
+            f"return {section.returns}"
         ]
 
-        for statement in section.statements:
-            if statement.is_assigned():
-                func_elements.append(
-                    self.get_func_statement_str(statement, section)
-                )
+        return ("\n\n" + self.indent).join(
+            func_elements
+        )
 
-        func_elements.append(
-            self.get_func_return_str(section)
+    def get_vectorized_section_code_str(self, section: Section):
+        """
+        Generate a numba ufunc variant of a section function.
+
+        The variant wraps the same unit-free body in
+        vectorize(target='parallel', fastmath=True) so callers evaluating
+        the section over arrays of states get broadcast, SIMD and threaded
+        execution.
+        """
+        func_name = get_code_name(section.name, self.func_start_name) + "_v"
+        signature_args = self.get_signature_args(section)
+        parameters_str = comma_space.join(
+            self.get_parameter_str(arg) for arg in signature_args
         )
+        signature_str = comma_space.join(["float64"] * len(signature_args))
+
+        func_elements = [
+            newline.join(
+                [
+                    f"@vectorize([float64({signature_str})], target='parallel', fastmath=True)",
+                    f"def {func_name}({parameters_str}):",
+                ]
+            ),
+            self.get_code_docs_str(
+                signature_args,
+                f"{section.description} (unit-free ufunc variant)"
+            ),
+        ] + self.get_strip_units_statement_strs(section) + [
+            f"return {section.returns}"
+        ]
 
         return ("\n\n" + self.indent).join(
             func_elements
         )
 
+    def get_c_section_code_str(self, section: Section):
+        """
+        Generate a C function for a pure numeric section.
+
+        The function takes and returns doubles (magnitudes in the units
+        documented on the Python function) and translates each statement
+        with sympy.ccode.
+        """
+        func_name = get_code_name(section.name, self.func_start_name)
+        parameters_str = comma_space.join(
+            f"double {arg.name}" for arg in section.args
+        )
+
+        lines = [
+            f"/* {section.description} ({section.returns.units_str}) */",
+            f"double {func_name}({parameters_str}) {{",
+        ]
+        for statement in section.statements:
+            if statement.is_assigned():
+                if isinstance(statement.expression, (float, int)):
+                    expression_str = str(float(statement.expression))
+                else:
+                    expression_str = sympy.ccode(statement.expression)
+                lines.append(
+                    f"{self.indent}double {statement.name} = {expression_str};")
+        lines.append(f"{self.indent}return {section.returns};")
+        lines.append("}")
+        return newline.join(lines)
+
+    def generate_c_code(self, documentation: Documentation):
+        """
+        Write a C translation of the pure numeric sections of a documentation.
+
+        The generated <name>.c sits next to the generated Python module and
+        can be compiled into an extension (e.g. via cffi or a setup script)
+        when call overhead of the Python functions dominates. Sections with
+        piecewise expressions or calls into other sections are skipped.
+        """
+        generated_file_path = self.get_generated_file_path(
+            documentation).with_suffix(".c")
+        generated_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        c_sections = [
+            self.get_c_section_code_str(code_object)
+            for code_object in documentation.exports
+            if isinstance(code_object, Section)
+            and not isinstance(code_object.returns, ExternalFunctionSymbol)
+            and self.is_pure_numeric_section(code_object)
+        ]
+
+        c_code_str = ("\n" * 2).join(
+            ["#include <math.h>"] + c_sections
+        )
+        with open(generated_file_path, "+w", encoding="utf-8") as f:
+            f.write(c_code_str)
+        logger.info(f"Finished writing to {generated_file_path}")
+
     def get_documentation_code_str(self, documentation: Documentation):
         module_imports:  dict[str, set] = dict()
 
         import_strings = [
             "import numpy as np",  # TODO: make this dynamically added
-            "from theoris.utils.units import ureg, validate_units",
-            "from pint import Quantity",
+        ] + (
+            [] if self.strip_units else [
+                "from theoris.utils.units import ureg, validate_units",
+                "from pint import Quantity",
+            ]
+        ) + [
             "from pydantic import BaseModel, Field",
-        ] + list(documentation.external_modules)
+        ] + (
+            ["from numba import njit, vectorize, float64"] if self.use_numba else []
+        ) + list(documentation.external_modules)
 
         root_import = newline.join(
             import_strings
@@ -281,9 +705,15 @@ class CodeGenerator:
                                 data_object.name, data_object.attributes)
                         )
                     code_objects.append(
-                        self.get_section_code_str(code_object)
+                        self.get_section_code_str(code_object, module_imports)
                     )
-                    self.load_module_imports(code_object, module_imports)
+                    if self.use_numba and self.is_pure_numeric_section(code_object):
+                        code_objects.append(
+                            self.get_fast_section_code_str(code_object)
+                        )
+                        code_objects.append(
+                            self.get_vectorized_section_code_str(code_object)
+                        )
 
             elif isinstance(code_object, DataObject):
                 code_objects.append(
@@ -1,8 +1,7 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import nbformat as nbf
-import matplotlib.pyplot as plt
-import networkx as nx
 from theoris import Documentation, BaseSymbol
 from theoris.section import Section
 from theoris.symbol import Symbol
@@ -62,6 +61,11 @@ class DocumentationGenerator:
         Returns:
             The path to the generated diagram image, or None if generation failed.
         """
+        # Deferred so importing theoris stays light; matplotlib/networkx only
+        # load once diagram generation is actually requested
+        from matplotlib.figure import Figure
+        import networkx as nx
+
         try:
             # Create a directed graph
             G = nx.DiGraph()
@@ -89,8 +93,11 @@ class DocumentationGenerator:
                 G.add_edge("section", "output")
 
             # Create the figure with a clean, white background
-            plt.figure(figsize=(12, 6), facecolor='white')
-            plt.title(
+            # The object-oriented Figure API avoids pyplot's global state,
+            # so sections can render concurrently in worker threads
+            fig = Figure(figsize=(12, 6), facecolor='white')
+            ax = fig.add_subplot(111)
+            ax.set_title(
                 f"Inputs and Outputs: {section.name}", fontsize=16, fontweight='bold')
 
             # Use a left-to-right layout
@@ -112,23 +119,23 @@ class DocumentationGenerator:
                 pos["output"] = (0.8, 0.5)
 
             # Draw input nodes
-            nx.draw_networkx_nodes(G, pos, nodelist=input_nodes,
+            nx.draw_networkx_nodes(G, pos, nodelist=input_nodes, ax=ax,
                                    node_color='#4285F4', node_size=2500,
                                    alpha=0.9, node_shape='o', edgecolors='#2C5AA0')
 
             # Draw section node
-            nx.draw_networkx_nodes(G, pos, nodelist=["section"],
+            nx.draw_networkx_nodes(G, pos, nodelist=["section"], ax=ax,
                                    node_color='#FBBC05', node_size=3500,
                                    alpha=0.9, node_shape='s', edgecolors='#E37400')
 
             # Draw output node if it exists
             if "output" in G:
-                nx.draw_networkx_nodes(G, pos, nodelist=["output"],
+                nx.draw_networkx_nodes(G, pos, nodelist=["output"], ax=ax,
                                        node_color='#34A853', node_size=2500,
                                        alpha=0.9, node_shape='o', edgecolors='#0F8C3B')
 
             # Draw edges
-            nx.draw_networkx_edges(G, pos, width=2.0, alpha=0.7,
+            nx.draw_networkx_edges(G, pos, width=2.0, alpha=0.7, ax=ax,
                                    edge_color='#5F6368', arrowsize=20,
                                    connectionstyle='arc3,rad=0.1')
 
@@ -137,7 +144,7 @@ class DocumentationGenerator:
             for n, d in G.nodes(data=True):
                 labels[n] = d.get('label', n)
 
-            nx.draw_networkx_labels(G, pos, labels=labels,
+            nx.draw_networkx_labels(G, pos, labels=labels, ax=ax,
                                     font_size=12, font_weight='bold',
                                     font_family='sans-serif')
 
@@ -146,14 +153,14 @@ class DocumentationGenerator:
                 if d.get('description') and n in pos:
                     x, y = pos[n]
                     if d.get('type') == 'input':
-                        plt.annotate(d.get('description'), xy=(x, y), xytext=(x-0.15, y),
+                        ax.annotate(d.get('description'), xy=(x, y), xytext=(x-0.15, y),
                                      arrowprops=dict(
                                          arrowstyle='->', color='gray'),
                                      bbox=dict(boxstyle='round,pad=0.5',
                                                fc='#E8F0FE', ec='gray', alpha=0.8),
                                      fontsize=10, ha='right')
                     elif d.get('type') == 'output':
-                        plt.annotate(d.get('description'), xy=(x, y), xytext=(x+0.15, y),
+                        ax.annotate(d.get('description'), xy=(x, y), xytext=(x+0.15, y),
                                      arrowprops=dict(
                                          arrowstyle='->', color='gray'),
                                      bbox=dict(boxstyle='round,pad=0.5',
@@ -170,11 +177,11 @@ class DocumentationGenerator:
                 Line2D([0], [0], marker='o', color='w',
                        markerfacecolor='#34A853', markersize=15, label='Output')
             ]
-            plt.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
-                       ncol=3, fontsize=12)
+            ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
+                      ncol=3, fontsize=12)
 
             # Remove axis
-            plt.axis('off')
+            ax.set_axis_off()
 
             # Save the figure
             diagram_dir = Path(self.docs_path, "diagrams")
@@ -185,9 +192,8 @@ class DocumentationGenerator:
             diagram_path = diagram_dir / diagram_filename
 
             # Save the diagram
-            plt.savefig(diagram_path, format="PNG",
+            fig.savefig(diagram_path, format="PNG",
                         dpi=150, bbox_inches='tight')
-            plt.close()
 
             # Log the diagram creation
             logger.info(f"Generated I/O diagram at {diagram_path}")
@@ -209,6 +215,10 @@ class DocumentationGenerator:
         Returns:
             The path to the generated diagram image, or None if generation failed.
         """
+        # Deferred for the same reason as in generate_section_io_diagram
+        from matplotlib.figure import Figure
+        import networkx as nx
+
         try:
             # Create a directed graph
             G = nx.DiGraph()
@@ -232,8 +242,10 @@ class DocumentationGenerator:
                     G.add_edge(f"A{j}", node_id)
 
             # Create the figure with a clean, white background
-            plt.figure(figsize=(12, 8), facecolor='white')
-            plt.title(
+            # Object-oriented Figure API again, for thread safety
+            fig = Figure(figsize=(12, 8), facecolor='white')
+            ax = fig.add_subplot(111)
+            ax.set_title(
                 f"Verification Diagram: {section.name}", fontsize=16, fontweight='bold')
 
             # Use a hierarchical layout for better structure
@@ -258,7 +270,7 @@ class DocumentationGenerator:
                     pos[node] = ((i + 1) * theorem_x_step, 0.2)
 
             # Draw assumption nodes with a professional blue color
-            nx.draw_networkx_nodes(G, pos, nodelist=assumption_nodes,
+            nx.draw_networkx_nodes(G, pos, nodelist=assumption_nodes, ax=ax,
                                    node_color='#4285F4', node_size=3000,
                                    alpha=0.9, node_shape='o', edgecolors='#2C5AA0')
 
@@ -269,23 +281,23 @@ class DocumentationGenerator:
                 'type') == 'theorem' and d.get('status') == 'VIOLATED']
 
             # Use a professional green for satisfied theorems
-            nx.draw_networkx_nodes(G, pos, nodelist=satisfied_nodes,
+            nx.draw_networkx_nodes(G, pos, nodelist=satisfied_nodes, ax=ax,
                                    node_color='#34A853', node_size=3000,
                                    alpha=0.9, node_shape='o', edgecolors='#0F8C3B')
 
             # Use a professional red for violated theorems
-            nx.draw_networkx_nodes(G, pos, nodelist=violated_nodes,
+            nx.draw_networkx_nodes(G, pos, nodelist=violated_nodes, ax=ax,
                                    node_color='#EA4335', node_size=3000,
                                    alpha=0.9, node_shape='o', edgecolors='#C62828')
 
             # Draw edges with a cleaner style
-            nx.draw_networkx_edges(G, pos, width=2.0, alpha=0.7,
+            nx.draw_networkx_edges(G, pos, width=2.0, alpha=0.7, ax=ax,
                                    edge_color='#5F6368', arrowsize=20,
                                    connectionstyle='arc3,rad=0.1')
 
             # Draw labels with better formatting
             labels = {n: d.get('label') for n, d in G.nodes(data=True)}
-            nx.draw_networkx_labels(G, pos, labels=labels,
+            nx.draw_networkx_labels(G, pos, labels=labels, ax=ax,
                                     font_size=11, font_weight='bold',
                                     font_family='sans-serif')
 
@@ -299,11 +311,11 @@ class DocumentationGenerator:
                 Line2D([0], [0], marker='o', color='w', markerfacecolor='#EA4335',
                        markersize=15, label='Violated Theorem')
             ]
-            plt.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
-                       ncol=3, fontsize=12)
+            ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
+                      ncol=3, fontsize=12)
 
             # Remove axis
-            plt.axis('off')
+            ax.set_axis_off()
 
             # Save the figure
             # Create diagrams directory in the docs path
@@ -315,9 +327,8 @@ class DocumentationGenerator:
             diagram_path = diagram_dir / diagram_filename
 
             # Save the diagram
-            plt.savefig(diagram_path, format="PNG",
+            fig.savefig(diagram_path, format="PNG",
                         dpi=150, bbox_inches='tight')
-            plt.close()
 
             # Log the diagram creation
             logger.info(f"Generated verification diagram at {diagram_path}")
@@ -338,6 +349,24 @@ class DocumentationGenerator:
         nb = nbf.v4.new_notebook()
         documentation_cells: list[nbf.NotebookNode] = []
 
+        # Render the per-section diagrams concurrently; each call draws onto
+        # its own Figure, so worker threads do not share any drawing state.
+        # The futures resolve while the markdown cells are assembled below.
+        documented_sections = [
+            code_object for code_object in documentation.exports
+            if isinstance(code_object, Section) and code_object.show_in_documentation
+        ]
+        executor = ThreadPoolExecutor()
+        io_diagram_futures = {
+            section: executor.submit(self.generate_section_io_diagram, section)
+            for section in documented_sections
+        }
+        verification_diagram_futures = {
+            section: executor.submit(self.generate_verification_diagram, section)
+            for section in documented_sections
+            if hasattr(section, 'theorems') and section.theorems
+        }
+
         for code_object in documentation.exports:
             if isinstance(code_object, Section):
                 if code_object.show_in_documentation:
@@ -350,8 +379,7 @@ class DocumentationGenerator:
                     )
 
                     # Add I/O diagram for the section
-                    io_diagram_path = self.generate_section_io_diagram(
-                        code_object)
+                    io_diagram_path = io_diagram_futures[code_object].result()
                     if io_diagram_path:
                         io_diagram_cell = nbf.v4.new_markdown_cell(
                             f"### Inputs and Outputs\n\n"
@@ -360,9 +388,8 @@ class DocumentationGenerator:
                         documentation_cells.append(io_diagram_cell)
 
                     # Add verification diagram if the section has verification capabilities
-                    if hasattr(code_object, 'theorems') and code_object.theorems:
-                        diagram_path = self.generate_verification_diagram(
-                            code_object)
+                    if code_object in verification_diagram_futures:
+                        diagram_path = verification_diagram_futures[code_object].result()
                         if diagram_path:
                             diagram_cell = nbf.v4.new_markdown_cell(
                                 f"### Verification Diagram\n\n"
@@ -380,6 +407,8 @@ class DocumentationGenerator:
             elif isinstance(code_object, BaseSymbol):
                 global_symbols.append(code_object)
 
+        executor.shutdown()
+
         title_cell = nbf.v4.new_markdown_cell(f"# {documentation.name}")
         nomenclature_str = self.get_nomenclature_str(nomenclature_symbols)
         nomenclature_cell = nbf.v4.new_markdown_cell(nomenclature_str)
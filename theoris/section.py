@@ -13,7 +13,8 @@ try:
         PropertyConstraint,
         EquivalenceConstraint,
         ImplicationConstraint,
-        ProofResult
+        ProofResult,
+        verify_constraints
     )
     from theoris.verification.pysmt_interface import SymbolicExpression
     VERIFICATION_AVAILABLE = True
@@ -442,8 +443,10 @@ class Section(DocObject):
             """
             results = {}
 
-            for theorem in self.theorems:
-                result = theorem.verify()
+            # Theorems added through this section share its assumptions, so
+            # they are checked in one solver session
+            for theorem, result in zip(self.theorems,
+                                       verify_constraints(self.theorems)):
                 results[theorem.description] = result
 
             self.proof_results = results
@@ -1,11 +1,10 @@
 from theoris.utils.ordered_set import OrderedSet
 import sympy
 from pint import Quantity
-from theoris.utils.units import ureg
+from theoris.utils.units import ureg, DIMENSIONLESS, parse_units
 from theoris.section import Section
 from theoris.base_symbol import BaseSymbol, SymbolCodeCtx
-from theoris.utils.sympy import LatexPrinter
-from sympy.printing.numpy import NumPyPrinter
+from theoris.utils.sympy import LatexPrinter, NumPyPrinter
 from theoris.utils.logging import logger
 from theoris.utils.ordered_set import OrderedSet
 import uuid
@@ -44,6 +43,17 @@ class Symbol(BaseSymbol):
 
     Inherits all attributes from ISymbol.
     """
+
+    __slots__ = (
+        "expression",
+        "definitions",
+        "is_magnitude",
+        "constraints",
+        "theorems",
+        "proof_results",
+        "_dependency_cache",
+    )
+
     def __new__(cls,
                 name: str,
                 expression=None,
@@ -114,6 +124,7 @@ class Symbol(BaseSymbol):
         units = Symbol.get_units(self.expression, units, name=name)
         self.definitions = {"default": self}
         self.is_magnitude = is_magnitude
+        self._dependency_cache = None
 
         # Initialize verification attributes if verification is available
         if VERIFICATION_AVAILABLE:
@@ -132,13 +143,20 @@ class Symbol(BaseSymbol):
         If this symbol is the return value of a section, it depends on the section's arguments.
         If this symbol has an expression, it depends on the symbols in that expression.
 
+        The expression walk is cached per symbol since sections re-query
+        dependencies repeatedly while resolving statement order; the cache is
+        invalidated whenever the expression changes.
+
         Returns:
             OrderedSet of ISymbol objects that this symbol depends on.
         """
         if self.section is not None and self == self.section.returns:
             return self.section.args
         if isinstance(self.expression, sympy.Basic):
-            return OrderedSet(self.expression.atoms(BaseSymbol))
+            if self._dependency_cache is None:
+                self._dependency_cache = OrderedSet(
+                    self.expression.atoms(BaseSymbol))
+            return self._dependency_cache
         return super().get_dependencies()
 
     def set_expression(self, expression: BaseSymbol):
@@ -149,6 +167,7 @@ class Symbol(BaseSymbol):
             expression: The symbolic expression this symbol should represent.
         """
         self.expression = expression
+        self._dependency_cache = None
 
     def add_definition(self, definition: BaseSymbol):
         """
@@ -173,6 +192,63 @@ class Symbol(BaseSymbol):
 
         self.definitions[definition.name] = new_symbol
 
+    @classmethod
+    def batch(cls, specs: List[dict]) -> List["Symbol"]:
+        """
+        Create several unassigned symbols in one pass.
+
+        This classmethod is a fast path for the common pattern of unpacking a
+        block of plain input symbols. Each Symbol is allocated through
+        sympy.Symbol.__new__ and its metadata is assigned directly in a tight
+        loop, skipping the expression and unit inference performed by __init__
+        (none of which applies to symbols without an expression).
+
+        Args:
+            specs: List of dictionaries, each with a required "name" key and
+                   optional "description", "latex", "units" and "num_type" keys.
+
+        Returns:
+            List of Symbol objects in the same order as specs.
+        """
+        symbols = []
+        for spec in specs:
+            name = spec["name"]
+            symbol = sympy.Symbol.__new__(cls, str(uuid.uuid4()) + name)
+            symbol.expression = None
+            symbol.definitions = {"default": symbol}
+            symbol.is_magnitude = False
+            symbol._dependency_cache = None
+            if VERIFICATION_AVAILABLE:
+                symbol.constraints = []
+                symbol.theorems = []
+                symbol.proof_results = {}
+            symbol.name = name
+            symbol.description = spec.get("description", name)
+            symbol.latex = spec.get("latex", name)
+            # Normalize units the same way BaseSymbol.__init__ does, so
+            # batch-made symbols compare and combine like ordinary ones
+            units = spec.get("units")
+            if units is None:
+                symbol.units = DIMENSIONLESS
+            elif isinstance(units, Quantity):
+                symbol.units = units
+            elif isinstance(units, str):
+                symbol.units = parse_units(units)
+            else:
+                try:
+                    symbol.units = ureg.Quantity(1, units)
+                except:
+                    logger.warning(
+                        f"{name} has invalid units {units}, using dimensionless")
+                    symbol.units = DIMENSIONLESS
+            symbol.num_type = spec.get("num_type", "real")
+            symbol.section = None
+            symbol.is_global = False
+            symbol.is_simplified = False
+            symbol.has_forced_unit_conversion = False
+            symbols.append(symbol)
+        return symbols
+
     @staticmethod
     def inherit(symbol: BaseSymbol,
                 expression: BaseSymbol = None,
@@ -262,7 +338,7 @@ class Symbol(BaseSymbol):
                     # If multiplication fails, use dimensionless
                     logger.warning(
                         f"{name} could not determine units from multiplication")
-                    return ureg.dimensionless
+                    return DIMENSIONLESS
 
             if len(arg_symbols) == 2 and isinstance(expression, sympy.Add):
                 # For addition, units must be compatible, use the first one
@@ -274,7 +350,7 @@ class Symbol(BaseSymbol):
                     # If comparison fails, use dimensionless
                     logger.warning(
                         f"{name} could not determine units from addition")
-                    return ureg.dimensionless
+                    return DIMENSIONLESS
 
             if len(arg_symbols) == 2 and isinstance(expression, sympy.Pow):
                 # For power operations, handle specially
@@ -286,15 +362,15 @@ class Symbol(BaseSymbol):
                         # If power fails, use dimensionless
                         logger.warning(
                             f"{name} could not determine units from power")
-                        return ureg.dimensionless
+                        return DIMENSIONLESS
 
             # If we can't determine units from the expression structure,
             # log a warning and use dimensionless
             logger.warning(f"{name} could not determine units from expression")
-            return ureg.dimensionless
+            return DIMENSIONLESS
 
         # If no expression or no atoms in expression, use dimensionless
-        return ureg.dimensionless
+        return DIMENSIONLESS
 
     def is_assigned(self):
         """
@@ -345,6 +421,11 @@ class Symbol(BaseSymbol):
             .replace("numpy.", "np.")
         )
 
+        # In unit-stripped mode the values are plain floats, so no Quantity
+        # wrapping or magnitude extraction is needed
+        if ctx.strip_units:
+            return f"{self.name} = {numpy_code_str}"
+
         # Handle special cases
         if isinstance(self.expression, sympy.Piecewise) or isinstance(self.expression, (float, int)):
             # For piecewise expressions or literals, explicitly add units
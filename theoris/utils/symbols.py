@@ -1,3 +1,4 @@
+from functools import lru_cache
 import numpy as np
 from theoris.utils.ordered_set import OrderedSet
 from theoris.base_symbol import BaseSymbol
@@ -6,6 +7,7 @@ from theoris.utils.ordered_set import OrderedSet
 np.seterr(all='ignore')
 
 
+@lru_cache(maxsize=None)
 def get_code_name(name: str, start_name: str = None, is_camel_case=True):
     cleaned_name = (
         name
@@ -49,20 +51,29 @@ def is_symbol_constant(symbol: BaseSymbol):
 
 def resolve(expr: BaseSymbol, substitutions: dict = {}, no_resolve: list[BaseSymbol] = []) -> BaseSymbol:
     next_expr = expr
-    dep_symbols = next_expr.atoms(BaseSymbol)
 
-    for symbol in dep_symbols:
-        if isinstance(symbol, BaseSymbol) and symbol not in no_resolve:
-            if (symbol in substitutions):
-                next_expr = next_expr.subs(symbol, substitutions[symbol])
-            else:
-                if hasattr(symbol, 'expression'):
-                    next_expr = next_expr.subs(symbol, symbol.expression)
-                    if symbol.is_assigned():
-                        next_expr = resolve(
-                            next_expr, substitutions, no_resolve)
+    while True:
+        # Collect all replacements for this level into one dict so each
+        # level costs a single hash-based xreplace traversal instead of a
+        # pattern-matching subs pass per symbol
+        replacements = {}
+        has_assigned_replacement = False
+        for symbol in next_expr.atoms(BaseSymbol):
+            if isinstance(symbol, BaseSymbol) and symbol not in no_resolve:
+                if (symbol in substitutions):
+                    replacements[symbol] = substitutions[symbol]
+                elif hasattr(symbol, 'expression') and symbol.is_assigned():
+                    # Unassigned symbols were silent subs no-ops before;
+                    # xreplace cannot take their None expressions
+                    replacements[symbol] = symbol.expression
+                    has_assigned_replacement = True
 
-    return next_expr
+        if len(replacements) == 0:
+            return next_expr
+        next_expr = next_expr.xreplace(replacements)
+        # Substituted expressions may themselves reference assigned symbols
+        if not has_assigned_replacement:
+            return next_expr
 
 
 def resolve_symbols(expr: BaseSymbol, substitutions: dict = {}, no_resolve: list[BaseSymbol] = []):
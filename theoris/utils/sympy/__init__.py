@@ -1,2 +1,3 @@
 from .latex import LatexPrinter
+from .numpy import NumPyPrinter
 from .printer import Printer
@@ -0,0 +1,72 @@
+"""
+A Printer which converts an expression into NumPy source code.
+"""
+
+import sympy
+from sympy.printing.numpy import NumPyPrinter as SympyNumPyPrinter
+from sympy.printing.precedence import PRECEDENCE
+
+
+class NumPyPrinter(SympyNumPyPrinter):
+    """
+    NumPy printer with `numpy.where` piecewise output and power fast paths.
+
+    SymPy's stock printer renders Piecewise as `numpy.select`, which builds
+    intermediate condition/choice lists on every call. For the two-branch
+    piecewise expressions that dominate generated sections, nested
+    `numpy.where(cond, val_true, val_false)` evaluates with plain ufunc
+    dispatch and broadcasts over array inputs in a single pass.
+
+    Small fixed powers likewise avoid libm pow: squares and cubes print as
+    repeated multiplication and integer-valued float exponents print as
+    integer exponents, so numpy evaluates them with multiplies instead of
+    exp(b*log(a)).
+    """
+
+    def _print_Pow(self, expr, rational=False):
+        base, exp = expr.as_base_exp()
+        if exp.is_number and exp.is_real:
+            if exp == 2 or exp == 3:
+                base_str = self.parenthesize(base, PRECEDENCE["Mul"])
+                return "*".join([base_str] * int(exp))
+            if exp == -0.5:
+                return "1/{}({})".format(
+                    self._module_format(self._module + '.sqrt'),
+                    self._print(base))
+            if isinstance(exp, (sympy.Integer, sympy.Float)) and exp == int(exp):
+                return "{}**({})".format(
+                    self.parenthesize(base, PRECEDENCE["Pow"]), int(exp))
+        return super()._print_Pow(expr, rational=rational)
+
+    def _print_Max(self, expr):
+        # The stock printer falls back to numpy.amax over a tuple, which
+        # fails for array arguments and is unsupported under numba; the
+        # maximum ufunc broadcasts and compiles. Fold n-ary Max pairwise.
+        maximum = self._module_format(self._module + '.maximum')
+        code = self._print(expr.args[0])
+        for arg in expr.args[1:]:
+            code = "{}({}, {})".format(maximum, code, self._print(arg))
+        return code
+
+    def _print_Min(self, expr):
+        minimum = self._module_format(self._module + '.minimum')
+        code = self._print(expr.args[0])
+        for arg in expr.args[1:]:
+            code = "{}({}, {})".format(minimum, code, self._print(arg))
+        return code
+
+    def _print_Piecewise(self, expr):
+        where = self._module_format(self._module + '.where')
+        branches = list(expr.args)
+        if branches[-1].cond == True:
+            default = self._print(branches[-1].expr)
+            branches = branches[:-1]
+        else:
+            # No catch-all branch: out-of-domain inputs evaluate to nan,
+            # matching the stock printer's default
+            default = self._module_format(self._module + '.nan')
+        code = default
+        for value, condition in reversed(branches):
+            code = "{}({}, {}, {})".format(
+                where, self._print(condition), self._print(value), code)
+        return code
@@ -1,11 +1,26 @@
 from typing import Any, Callable, Dict
 import numpy as np
-from functools import wraps
+from functools import lru_cache, wraps
 from pint import UnitRegistry, Quantity
 
 # Create a unit registry
 ureg = UnitRegistry()
 
+# Shared dimensionless quantity; resolving ureg.dimensionless goes through
+# pint's registry lookup, so symbols default to this single object instead
+DIMENSIONLESS = ureg.dimensionless
+
+
+@lru_cache(maxsize=None)
+def parse_units(units: str) -> Quantity:
+    """
+    Parse a unit string through the shared registry, memoized.
+
+    Repeated symbols frequently carry the same unit strings; caching the
+    parse means each distinct string pays pint's expression parsing once.
+    """
+    return ureg.parse_expression(units)
+
 
 def validate_unit_from_arg_values(arg_values: Any, expected_units_values: list, rescaled_args: list):
     for i, arg_value in enumerate(arg_values):
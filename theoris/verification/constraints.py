@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, Union, List, Tuple
 from theoris.base_symbol import BaseSymbol
 from theoris.verification.pysmt_interface import (
     verify_property,
+    verify_properties,
     check_equivalence,
     check_implication,
     SymbolicExpression
@@ -241,3 +242,47 @@ class ImplicationConstraint(Constraint):
             proof_time=proof_time,
             description=self.description
         )
+
+
+def verify_constraints(constraints: List[Constraint]) -> List[ProofResult]:
+    """
+    Verify a list of constraints, sharing one solver context when possible.
+
+    Constraints with identical assumptions are checked in a single solver
+    session via verify_properties, avoiding a solver startup and assumption
+    round-trip per constraint. When the assumptions differ the constraints
+    fall back to their individual verify methods.
+
+    Args:
+        constraints: The constraints to verify.
+
+    Returns:
+        A list of ProofResult objects, one per constraint, in order.
+    """
+    if not constraints:
+        return []
+
+    shared_assumptions = constraints[0].assumptions
+    if any(constraint.assumptions != shared_assumptions
+           for constraint in constraints[1:]):
+        return [constraint.verify() for constraint in constraints]
+
+    start_time = time.time()
+    outcomes = verify_properties(
+        [constraint.expression for constraint in constraints],
+        shared_assumptions
+    )
+    # Solver startup and assumption assertions are shared, so split the
+    # wall time evenly across the results
+    proof_time = (time.time() - start_time) / len(constraints)
+
+    return [
+        ProofResult(
+            is_satisfied=is_satisfied,
+            counterexample=counterexample,
+            proof_time=proof_time,
+            description=constraint.description
+        )
+        for constraint, (is_satisfied, counterexample)
+        in zip(constraints, outcomes)
+    ]
@@ -202,6 +202,70 @@ def verify_property(expr: SymbolicExpression,
             return True, None
 
 
+def verify_properties(properties: List[SymbolicExpression],
+                      assumptions: Optional[List[SymbolicExpression]] = None) -> List[Tuple[bool, Optional[Dict[str, Any]]]]:
+    """
+    Verify several properties sharing one solver context.
+
+    Solver startup and the assumption assertions are paid once; each property
+    is then checked by pushing a scope, asserting its negation and popping,
+    instead of spinning up a fresh solver per property.
+
+    Args:
+        properties: The properties to verify (as sympy expressions).
+        assumptions: Optional list of assumptions shared by all properties.
+
+    Returns:
+        A list of (is_valid, counterexample) tuples, one per property, with
+        the same meaning as verify_property. Properties that cannot be
+        converted are reported as valid, matching the single-property
+        fallback behavior.
+    """
+    assumption_converter = SymPyToPySMTConverter()
+    results = []
+
+    with Solver() as solver:
+        if assumptions:
+            assumption_formulas = [assumption_converter.convert(
+                assumption) for assumption in assumptions]
+            if assumption_formulas:
+                solver.add_assertion(And(assumption_formulas))
+
+        # Asserting the assumptions up front and the negated property per
+        # scope is equivalent to checking Not(assumptions -> property)
+        for expr in properties:
+            # Seed a per-property converter with the assumption symbols so
+            # each counterexample reports only the symbols of the assumptions
+            # and of this property, as the single-property path does (PySMT
+            # interns symbols by name, so the formulas still unify)
+            converter = SymPyToPySMTConverter()
+            converter.symbol_map.update(assumption_converter.symbol_map)
+            try:
+                formula = converter.convert(expr)
+            except ValueError as e:
+                print(f"Warning: Could not check property: {e}")
+                results.append((True, None))
+                continue
+
+            solver.push()
+            solver.add_assertion(Not(formula))
+            is_sat_result = solver.solve()
+
+            if is_sat_result:
+                # The property is not valid, get a counterexample
+                model = solver.get_model()
+                counterexample = {
+                    str(symbol): float(model.get_value(smt_symbol).constant_value())
+                    for symbol, smt_symbol in converter.symbol_map.items()
+                }
+                results.append((False, counterexample))
+            else:
+                results.append((True, None))
+            solver.pop()
+
+    return results
+
+
 def check_equivalence(expr1: SymbolicExpression,
                       expr2: SymbolicExpression,
                       assumptions: Optional[List[SymbolicExpression]] = None) -> Tuple[bool, Optional[Dict[str, Any]]]: